@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+
+__author__ = 'Lojack'
+__all__ = [
+    'compile_function',
+]
+
+
+from typing import Any, Callable, Dict
+
+
+def compile_function(
+        name: str,
+        source: str,
+        namespace: Dict[str, Any]
+    ) -> Callable:
+    """Compile generated source code defining a single function.
+
+    :param name: Name of the function defined in `source`.
+    :param source: Python source code defining the function.
+    :param namespace: Globals used by the generated function.  The function
+        is also stored here.
+    :return: The newly created function.
+    """
+    exec(compile(source, f'<generated {name}>', 'exec'), namespace)
+    return namespace[name]
@@ -9,20 +9,23 @@ __all__ = [
 
 from functools import partial, wraps
 import inspect
-from inspect import Signature
+from inspect import Parameter, Signature
+from itertools import repeat
 import sys
-from typing import Any, Callable, Dict, get_args, get_origin, get_type_hints, \
-    Optional, Union, Tuple, TypeVar
+from types import FunctionType
+from typing import Any, Callable, Dict, get_args, get_origin, \
+    Iterable, List, Optional, Union, Tuple, TypeVar
+from weakref import WeakValueDictionary
+
+from ._codegen import compile_function
 
 
 if sys.version_info >= (3, 10):
-    from functools import cache
     from typing import TypeAlias, TypeGuard
     from types import UnionType
     _sig_args = {'eval_str': True}
     _UnionTypes = (Union, UnionType)
 else:
-    from functools import lru_cache as cache
     from typing_extensions import TypeAlias, TypeGuard
     _sig_args = {}
     _UnionTypes = (Union,)
@@ -31,6 +34,10 @@ else:
 _BoundConversion: TypeAlias = Callable[[Any], Any]
 _UnboundConversion: TypeAlias = Callable[[Any, Any], Any]
 _Conversion: TypeAlias = Union[_BoundConversion, _UnboundConversion]
+_CallPlan: TypeAlias = Tuple[
+    Optional[Union[int, str]],
+    Tuple[Tuple[Union[int, str], Any, bool], ...]
+]
 T = TypeVar('T')
 
 
@@ -52,6 +59,8 @@ def eval_annotation(method: Callable, annotation: Any) -> Any:
 
 class _TypeConverter:
     """Base class for all type converters."""
+    __slots__ = ()
+
     def __call__(self, *args, **kwargs):
         raise NotImplementedError   # pragma: no cover
 
@@ -60,7 +69,7 @@ class _UnboundTypeConverter(_TypeConverter):
     """Base class used as a marker to note that a _TypeConverter uses one or
     more unbound instance methods in its conversion.
     """
-    pass
+    __slots__ = ()
 
 
 class _UnionConverter(_TypeConverter):
@@ -68,47 +77,104 @@ class _UnionConverter(_TypeConverter):
     converter for each type. The converters are not unbound instance/class
     methods. If no matching converter is found, the value is return unchanged.
     """
+    __slots__ = ('_converters', '_items', '_by_type')
     _converters: Dict[type, _TypeConverter]
+    _items: Tuple[Tuple[type, _TypeConverter], ...]
+    _by_type: Dict[type, Optional[_TypeConverter]]
 
     def __init__(self, converters: Dict[type, _TypeConverter]):
         self._converters = converters
+        # Entries are tried in order, so an entry can never match if an
+        # earlier entry is for one of its base classes.  Drop those.
+        items: List[Tuple[type, _TypeConverter]] = []
+        for source_type, converter in converters.items():
+            if not any((issubclass(source_type, seen) for seen, _ in items)):
+                items.append((source_type, converter))
+        self._set_items(items)
+
+    def _set_items(self, items: Iterable[Tuple[type, Any]]) -> None:
+        """Set the (type, converter) pairs used for dispatching, and reset the
+        type lookup table.  Since unreachable entries have been dropped, a
+        value whose exact type has an entry always uses that entry.
+
+        :param items: The (type, converter) pairs, in matching order.
+        """
+        self._items = tuple(items)
+        self._by_type = dict(self._items)
+
+    def _resolve(self, value: Any) -> Optional[_TypeConverter]:
+        """Find the converter for a value whose type has no entry in the lookup
+        table, and remember it so later values of that type only need a dict
+        lookup.  Values that report a different `__class__` than their type
+        (mocks, proxies) are matched with isinstance, and not remembered.
+
+        :param value: The value being converted.
+        :return: The converter for the first matching entry, or None if no
+            entry matches.
+        """
+        value_type = type(value)
+        if value.__class__ is not value_type:
+            for source_type, converter in self._items:
+                if isinstance(value, source_type):
+                    return converter
+            return None
+        for source_type, converter in self._items:
+            if issubclass(value_type, source_type):
+                break
+        else:
+            converter = None    # type: ignore
+        if len(self._by_type) < _MAX_UNION_TYPES:
+            self._by_type[value_type] = converter
+        return converter
 
     def __call__(self, value: Any) -> Any:
-        for source_type, converter in self._converters.items():
-            if isinstance(value, source_type):
-                return converter(value)
-        return value
+        converter = self._by_type.get(type(value), _missing)
+        if converter is _missing:
+            converter = self._resolve(value)
+        if converter is None:
+            return value
+        return converter(value)    # type: ignore
 
 
 class _UnboundUnionConverter(_UnionConverter, _UnboundTypeConverter):
     """A UnionConverter for which all conversion methods are unbound instance
        or class methods.
     """
+    __slots__ = ()
+
     def __call__(self, instance: Any, value: Any) -> Any:
-        for source_type, converter in self._converters.items():
-            if isinstance(value, source_type):
-                return converter(instance, value)
-        return value
+        converter = self._by_type.get(type(value), _missing)
+        if converter is _missing:
+            converter = self._resolve(value)
+        if converter is None:
+            return value
+        return converter(instance, value)  # type: ignore
 
 
-class _MixedUnionConverter(_UnionConverter, _UnboundTypeConverter):
+class _MixedUnionConverter(_UnboundUnionConverter):
     """A UnionConverter for which some conversion methods are unbound instance
        or class methods.
     """
-    def __call__(self, instance: Any, value: Any) -> Any:
-        for source_type, converter in self._converters.items():
-            if isinstance(value, source_type):
-                if isinstance(converter, _UnboundConverter):
-                    return converter(instance, value)
-                else:
-                    return converter(value)
-        return value
+    __slots__ = ()
+
+    def __init__(self, converters: Dict[type, _TypeConverter]):
+        super().__init__(converters)
+        # Adapt the bound converters to the unbound call signature, so every
+        # converter is called the same way as in an _UnboundUnionConverter.
+        self._set_items(
+            (source_type, converter)
+            if isinstance(converter, _UnboundTypeConverter)
+            else (source_type,
+                  lambda instance, value, _convert=converter: _convert(value))
+            for source_type, converter in self._items
+        )
 
 
 class _Converter(_TypeConverter):
     """A _TypeConverter which converts a type using a single argument function
     or type constructor.
     """
+    __slots__ = ('_convert',)
     _convert: _BoundConversion
 
     def __init__(self, converter: _BoundConversion) -> None:
@@ -122,6 +188,7 @@ class _UnboundConverter(_UnboundTypeConverter):
     """A converter which converts a type using an unbound instance or class
     method.
     """
+    __slots__ = ('_convert',)
     _convert: _UnboundConversion
 
     def __init__(self, converter: _UnboundConversion) -> None:
@@ -132,103 +199,262 @@ class _UnboundConverter(_UnboundTypeConverter):
 
 
 def _noop_converter(x: T) -> T:
-    """Internal method used in two situations:
-    1) Used to denote that no conversion is required.
-    2) Used in _ArgsConverter to simplify the conversion loop for arguments
-       that do not require conversion.
-    """
+    """Internal method used to denote that no conversion is required."""
     return x
 
 
+def _unwrap_converter(converter: _TypeConverter) -> Callable:
+    """Get the callable that does the actual conversion for a type converter,
+    so generated code can call it directly.
+
+    :param converter: The type converter to unwrap.
+    :return: The wrapped conversion method for single type converters,
+        otherwise the converter itself.
+    """
+    if isinstance(converter, (_Converter, _UnboundConverter)):
+        return converter._convert
+    return converter
+
+
+def _is_plain_function(func: Any) -> bool:
+    """Check if a function's `__annotations__` are the same annotations its
+    signature would report.  Wrapped functions, or those with an explicit
+    `__signature__`, are not considered, since their signatures may differ.
+
+    :param func: The function to check.
+    :return: True if `func` is a plain function.
+    """
+    return (isinstance(func, FunctionType) and
+            not hasattr(func, '__wrapped__') and
+            not hasattr(func, '__signature__'))
+
+
+def _is_unannotated(func: Any) -> bool:
+    """Quick check for plain functions without any annotations, which never
+    need conversions.
+
+    :param func: The function to check.
+    :return: True if `func` is a plain function with no annotations.
+    """
+    return _is_plain_function(func) and not func.__annotations__
+
+
+# Sentinel for arguments not supplied by the caller
+_missing = object()
+
+# Signatures parsed by `ConversionWrapper.signature`, keyed by their source
+_string_signatures: Dict[str, Signature] = {}
+
+# Maximum number of annotations cached by each _TypeConverterFactory
+_MAX_CACHED_ANNOTATIONS = 1024
+# Maximum number of value types remembered by each _UnionConverter
+_MAX_UNION_TYPES = 256
+# Maximum number of call shapes cached by each _ArgsConverter
+_MAX_CALL_PLANS = 64
+_positional_kinds = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+_keyword_kinds = (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+_variadic_kinds = (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+
+
+def _conversion_source(
+        sig: Signature,
+        conversions: Dict[str, _TypeConverter],
+        namespace: Dict[str, Any]
+    ) -> Optional[Tuple[str, List[str]]]:
+    """Generate source code for a function with the same parameters as `sig`,
+    which applies `conversions` to its arguments inline.  Converters and
+    default values needed by the generated code are added to `namespace`.
+
+    :param sig: The signature to generate parameters for.
+    :param conversions: Mapping of parameter names to their type converters.
+    :param namespace: Globals to be used by the generated function.
+    :return: A tuple of (parameters, body), where `parameters` is the source
+        for the parameter list, and `body` is a list of indented source lines
+        applying the conversions. None if the signature contains parameters
+        other than positional-or-keyword ones, or if any parameter names would
+        shadow the generated globals.
+    """
+    parameters = sig.parameters
+    if any((parameter.kind is not Parameter.POSITIONAL_OR_KEYWORD
+            for parameter in parameters.values())):
+        return None
+    if conversions.get('self', _noop_converter) is not _noop_converter:
+        # Unbound converters expect the unconverted instance
+        return None
+    namespace['_missing'] = _missing
+    instance = 'self' if 'self' in parameters else 'None'
+    arg_list, body = [], []
+    for index, (name, parameter) in enumerate(parameters.items()):
+        converter = conversions.get(name, _noop_converter)
+        has_default = parameter.default is not Parameter.empty
+        if has_default:
+            namespace[f'_default{index}'] = parameter.default
+        if converter is _noop_converter:
+            arg_list.append(f'{name}=_default{index}' if has_default else name)
+            continue
+        namespace[f'_convert{index}'] = _unwrap_converter(converter)
+        if isinstance(converter, _UnboundTypeConverter):
+            call = f'_convert{index}({instance}, {name})'
+        else:
+            call = f'_convert{index}({name})'
+        if has_default:
+            # Defaults are passed through unconverted
+            arg_list.append(f'{name}=_missing')
+            call = f'_default{index} if {name} is _missing else {call}'
+        else:
+            arg_list.append(name)
+        body.append(f'    {name} = {call}')
+    if not namespace.keys().isdisjoint(parameters):
+        # Parameter names would shadow the generated globals
+        return None
+    return ', '.join(arg_list), body
+
+
+def _fixup_none(annotation: Any) -> Any:
+    """None-types are usually annotated as `None`, however `None` is a
+    constant of type `NoneType`.  Automatically convert `None`s to
+    `NoneType`s so `issubclass` and `isinstance` checks work property on
+    them.
+
+    :param annotation: The annotation to potentially fix.
+    :return: `NoneType` if the annotation is `None`, otherwise the
+        annotation is returned unchanged.
+    """
+    if annotation is None:
+        return type(None)
+    return annotation
+
+
+def _is_union(annotation: Any) -> bool:
+    """Determine if an annotation is a union annotation (defined using
+    either `Union[t1, ...]`, `t1 | ...`, or `Optional[t1]`).
+
+    :param annotation: The type annotation to test.
+    :return: True if the annotation is a union.
+    """
+    return get_origin(annotation) in _UnionTypes
+
+
+def _flatten_union(annotation: Any) -> Tuple[Any, ...]:
+    """Get the member types of a union annotation, recursively unwrapping any
+    nested unions.  `None`s are converted to `NoneType`, and duplicates are
+    removed while preserving order.
+
+    :param annotation: The union annotation to flatten.
+    :return: A tuple of the non-union types making up the union.
+    """
+    members: Dict[Any, None] = {}
+    for member in get_args(annotation):
+        if _is_union(member):
+            members.update(dict.fromkeys(_flatten_union(member)))
+        else:
+            members[_fixup_none(member)] = None
+    return tuple(members)
+
+
 class _TypeConverterFactory:
     """Machinery for managing all the type converters, and creating Union
     Converters on the fly.  Converters are accessed via type annotations.
     """
+    __slots__ = ('_converters', '_converter_cache', '__weakref__')
     _converters: Dict[type, _TypeConverter]
+    _converter_cache: Dict[Any, _TypeConverter]
 
     def __init__(self, converters: Dict[type, _Conversion]):
         for annotation in converters:
-            if self.is_union(annotation):
+            if _is_union(annotation):
                 raise TypeError(
                     f'Union type {annotation} is not supported as a single '
                     'converter.  Supply seperate converters for the underlying'
                     ' types.'
                 )
         self._converters = {
-            self.fixup_none(source_type): _UnboundConverter(converter)
-                                          if self.is_two_arg(converter)
-                                          else _Converter(converter) # type: ignore
+            _fixup_none(source_type): _UnboundConverter(converter)
+                                      if self.is_two_arg(converter)
+                                      else _Converter(converter) # type: ignore
             for source_type, converter in converters.items()
             if converter is not _noop_converter
         }
+        self._converter_cache = {}
 
-    @staticmethod
-    def fixup_none(annotation: Any) -> Any:
-        """None-types are usually annotated as `None`, however `None` is a
-        constant of type `NoneType`.  Automatically convert `None`s to
-        `NoneType`s so `issubclass` and `isinstance` checks work property on
-        them.
-
-        :param annotation: The annotation to potentially fix.
-        :return: `NoneType` if the annotation is `None`, otherwise the
-            annotation is returned unchanged.
-        """
-        if annotation is None:
-            return type(None)
-        return annotation
-
-    @staticmethod
-    def is_union(annotation: Any) -> bool:
-        """Determine if an annotation is a union annotation (defined using
-        either `Union[t1, ...]`, `t1 | ...`, or `Optional[t1]`).
-
-        :param annotation: The type annotation to test.
-        :return: True if the annotation is a union.
-        """
-        return get_origin(annotation) in _UnionTypes
+    # Kept for backwards compatibility
+    fixup_none = staticmethod(_fixup_none)
+    is_union = staticmethod(_is_union)
 
     @staticmethod
     def is_two_arg(converter: _Conversion) -> TypeGuard[_UnboundConversion]:
         """Lazy way to determine if a callable is an unbound instance or class
         method.  Note this will falsely detect bare methods with two arguments
         as unbound class or instance methods.
+
+        Plain functions are probed via their code object, which is much
+        cheaper than `inspect.signature`.  The signature is only used as a
+        fallback for builtins, classes, and other callables.
         """
+        if isinstance(converter, _TypeConverter):
+            # Already classified when it was registered
+            return isinstance(converter, _UnboundTypeConverter)
+        func, bound_args = converter, 0
+        if isinstance(func, partial):
+            bound_args += len(func.args)
+            func = func.func
+        if inspect.ismethod(func):
+            # Bound methods report the code object of the underlying function
+            bound_args += 1
+            func = func.__func__
         try:
-            sig = inspect.signature(converter)
-            return len(sig.parameters) == 2
-        except ValueError:
-            # Classes are callable, but may have no signature
-            # Also some third party libraries (wxPython...)
-            # we can't get signatures from.
-            return False
-
-    @cache
+            code = func.__code__
+        except AttributeError:
+            try:
+                sig = inspect.signature(converter)
+                return len(sig.parameters) == 2
+            except (ValueError, TypeError):
+                # Classes are callable, but may have no signature
+                # Also some third party libraries (wxPython...)
+                # we can't get signatures from.
+                return False
+        # Count every parameter the signature would report, defaulted or not
+        params = code.co_argcount + code.co_kwonlyargcount
+        params += bool(code.co_flags & inspect.CO_VARARGS)
+        params += bool(code.co_flags & inspect.CO_VARKEYWORDS)
+        return params - bound_args == 2
+
     def create_union_converter(self, annotation: Any) -> _TypeConverter:
-        """Create a _UnionConverter from a union type annotation.
+        """Create a _UnionConverter from a union type annotation.  Results are
+        cached by `get_type_converter`.
         
         :annotation: A union type annotation.
         :return: A `_UnionConverter` for handling any of the matched types, or
             `_noop_converter` if no types match.
         """
-        used_types = tuple(map(self.fixup_none, get_args(annotation)))
-        used_converters = {
-            source_type: converter
-            for source_type, converter in self._converters.items()
-            if any((issubclass(used_type, source_type)
-                    for used_type in used_types))
-        }
-        if not used_converters:
+        # `issubclass` with a tuple does the matching against every registered
+        # type in C, so union members without a converter are dropped early.
+        source_types = tuple(self._converters)
+        used_types = tuple(
+            used_type for used_type in _flatten_union(annotation)
+            if issubclass(used_type, source_types)
+        )
+        if not used_types:
             return _noop_converter  # type: ignore
-        unbound = list(map(self.is_two_arg, used_converters.values()))
+        used_converters = [
+            (source_type, converter, self.is_two_arg(converter))
+            for source_type, converter in self._converters.items()
+            if any(map(issubclass, used_types, repeat(source_type)))
+        ]
+        unbound = [is_unbound for _, _, is_unbound in used_converters]
         if all(unbound):
             # All unbound methods used for conversions
-            return _UnboundUnionConverter(used_converters)
+            union_type = _UnboundUnionConverter
         elif any(unbound):
             # Some are bound, some are unbound
-            return _MixedUnionConverter(used_converters)
+            union_type = _MixedUnionConverter
         else:
             # All bound methods
-            return _UnionConverter(used_converters)
+            union_type = _UnionConverter
+        return union_type({
+            source_type: converter
+            for source_type, converter, _ in used_converters
+        })
 
     def get_type_converter(self, annotation: Any) -> _TypeConverter:
         """Get a _TypeConverter object for the given annotation, creating a new
@@ -240,37 +466,193 @@ class _TypeConverterFactory:
         :return: A type converter object for converting types specified in
             `annotation`.
         """
-        annotation = self.fixup_none(annotation)
-        if self.is_union(annotation):
+        if annotation is Parameter.empty:
+            return _noop_converter  # type: ignore
+        try:
+            cached = self._converter_cache.get(annotation, _missing)
+        except TypeError:
+            # Unhashable annotation
+            return self._lookup_type_converter(annotation)
+        if cached is _missing:
+            cached = self._lookup_type_converter(annotation)
+            if len(self._converter_cache) < _MAX_CACHED_ANNOTATIONS:
+                self._converter_cache[annotation] = cached
+        return cached
+
+    def _lookup_type_converter(self, annotation: Any) -> _TypeConverter:
+        """Uncached implementation of `get_type_converter`."""
+        annotation = _fixup_none(annotation)
+        if _is_union(annotation):
             return self.create_union_converter(annotation)
         return self._converters.get(annotation, _noop_converter) # type: ignore
 
 
+# Factories currently in use, keyed by their converters
+_factories: WeakValueDictionary[tuple, _TypeConverterFactory] = \
+    WeakValueDictionary()
+
+
+def _shared_factory(
+        converters: Dict[type, _Conversion]
+    ) -> _TypeConverterFactory:
+    """Get a _TypeConverterFactory for the converters, sharing an existing one
+    if another `ConversionWrapper` uses the same converters.  This lets the
+    resolved converters for each annotation be reused between them.
+
+    :param converters: Mapping of types to conversion methods.
+    :return: A new or existing factory for those converters.
+    """
+    try:
+        # Order matters, it determines which union entries are tried first
+        key = tuple(converters.items())
+        factory = _factories.get(key, None)
+    except TypeError:
+        # Unhashable conversion methods
+        return _TypeConverterFactory(converters)
+    if factory is None:
+        factory = _factories[key] = _TypeConverterFactory(converters)
+    return factory
+
+
 class _ArgsConverter:
-    """Internal class which converts input values for a function."""
+    """Internal class which converts input values for a function.  Only used
+    by generic wrappers, when `ConversionWrapper` cannot generate a wrapper
+    specialized to the method.
+    """
+    __slots__ = ('_sig', '_conversions', '_ops', '_parameters', '_plans',
+                 '_bind_and_convert')
     _sig: Signature
     _conversions: Dict[str, _TypeConverter]
+    _ops: List[Tuple[str, _TypeConverter, bool]]
+    _parameters: List[Tuple[str, Any]]
+    _plans: Dict[tuple, _CallPlan]
+    _bind_and_convert: Callable[..., Tuple[tuple, Dict[str, Any]]]
 
     def __init__(self, sig: Signature, conversions: Dict[str, _TypeConverter]):
         self._sig = sig
         self._conversions = conversions
+        # (name, converter, is_unbound) for each argument needing conversion
+        self._ops = [
+            (name, converter, isinstance(converter, _UnboundTypeConverter))
+            for name, converter in conversions.items()
+            if converter is not _noop_converter
+        ]
+        # (name, kind) for each parameter, used to rebuild args and kwargs
+        self._parameters = [
+            (name, parameter.kind) for name, parameter in sig.parameters.items()
+        ]
+        self._plans = {}
+        kinds = dict(self._parameters)
+        if any((kinds[name] in _variadic_kinds for name, _, _ in self._ops)):
+            # Conversions on `*args` or `**kwargs` need the bound arguments
+            self._bind_and_convert = self._bind
+        else:
+            self._bind_and_convert = self._bind_planned
 
-    def __call__(self, *args, **kwargs):
-        """Convert values in args and kwargs as determined by the target
-        signature and converters.
-        
-        :return: (args, kwargs) with values converted.
+    def _plan_call(
+            self,
+            args: tuple,
+            kwargs: Dict[str, Any]
+        ) -> _CallPlan:
+        """Work out where each converted argument is passed for calls with the
+        same number of positional arguments and the same keyword arguments.
+
+        :raises TypeError: If the arguments cannot be bound to the signature.
+        :return: A tuple of (instance_location, operations).  Locations are
+            either an index into the positional arguments, or a keyword name.
+            `instance_location` is the location of the `self` argument, or
+            None if it was not passed.  `operations` holds (location,
+            converter, is_unbound) for each converted argument passed.
+        """
+        # Validates the call the same way the un-planned path would
+        self._sig.bind(*args, **kwargs)
+        locations: Dict[str, Union[int, str]] = {}
+        index = 0
+        for name, kind in self._parameters:
+            if kind in _positional_kinds and index < len(args):
+                locations[name] = index
+                index += 1
+            elif kind in _keyword_kinds and name in kwargs:
+                locations[name] = name
+        operations = tuple(
+            (locations[name], converter, unbound)
+            for name, converter, unbound in self._ops
+            if name in locations
+        )
+        return locations.get('self', None), operations
+
+    def _bind_planned(self, *args, **kwargs):
+        """Convert the arguments where the caller passed them, without filling
+        in defaults.  The locations of converted arguments are cached by call
+        shape, so `Signature.bind` only runs the first time a given shape is
+        seen.
+        """
+        key = (len(args), *kwargs)
+        if (plan := self._plans.get(key)) is None:
+            plan = self._plan_call(args, kwargs)
+            if len(self._plans) < _MAX_CALL_PLANS:
+                self._plans[key] = plan
+        instance_location, operations = plan
+        if instance_location is None:
+            instance = None
+        elif isinstance(instance_location, int):
+            instance = args[instance_location]
+        else:
+            instance = kwargs[instance_location]
+        new_args = list(args)
+        for location, converter, unbound in operations:
+            values = new_args if isinstance(location, int) else kwargs
+            if unbound:
+                values[location] = converter(instance, values[location])
+            else:
+                values[location] = converter(values[location])
+        return tuple(new_args), kwargs
+
+    def _bind(self, *args, **kwargs):
+        """Fallback conversion using `Signature.bind`, for signatures with
+        conversions on variadic parameters.
         """
         bound = self._sig.bind(*args, **kwargs)
         arguments = bound.arguments
         # 'self' instance for unbound conversion methods
         instance = arguments.get('self', None)
-        for name, converter in self._conversions.items():
-            if isinstance(converter, _UnboundTypeConverter):
+        for name, converter, unbound in self._ops:
+            if name not in arguments:
+                continue
+            if unbound:
                 arguments[name] = converter(instance, arguments[name])
             else:
                 arguments[name] = converter(arguments[name])
-        return bound.args, bound.kwargs
+        # Rebuild args and kwargs in a single pass, rather than through the
+        # `BoundArguments.args` and `BoundArguments.kwargs` properties.
+        new_args: List[Any] = []
+        new_kwargs: Dict[str, Any] = {}
+        positional = True
+        for name, kind in self._parameters:
+            if kind is Parameter.KEYWORD_ONLY or kind is Parameter.VAR_KEYWORD:
+                positional = False
+            if name not in arguments:
+                # Anything after a skipped parameter must be passed by keyword
+                positional = False
+                continue
+            value = arguments[name]
+            if kind is Parameter.VAR_KEYWORD:
+                new_kwargs.update(value)
+            elif kind is Parameter.VAR_POSITIONAL:
+                new_args.extend(value)
+            elif positional:
+                new_args.append(value)
+            else:
+                new_kwargs[name] = value
+        return tuple(new_args), new_kwargs
+
+    def __call__(self, *args, **kwargs):
+        """Convert values in args and kwargs as determined by the target
+        signature and converters.
+        
+        :return: (args, kwargs) with values converted.
+        """
+        return self._bind_and_convert(*args, **kwargs)
 
 
 class ConversionWrapper:
@@ -328,8 +710,8 @@ class ConversionWrapper:
         """
         return_converters = return_converters or {}
         input_converters = input_converters or {}
-        self._return_converters = _TypeConverterFactory(return_converters)
-        self._input_converters = _TypeConverterFactory(input_converters)
+        self._return_converters = _shared_factory(return_converters)
+        self._input_converters = _shared_factory(input_converters)
 
     def _get_callable_converters(
             self,
@@ -352,7 +734,7 @@ class ConversionWrapper:
             name: self._input_converters.get_type_converter(
                       eval_annotation(method, parameter.annotation))
             for name, parameter in type_hints.items()
-            if name != 'return'
+            if name != 'return' and parameter.annotation is not Parameter.empty
         }
         if not conversions:
             input_converter = None
@@ -367,6 +749,63 @@ class ConversionWrapper:
             return_annotation)
         return return_converter, input_converter
 
+    def _needs_conversion(self, method: Callable) -> bool:
+        """Used internally to check if any annotations on a plain function
+        have a matching converter, by reading `__annotations__` directly rather
+        than building a `Signature`.
+
+        :param method: The function to check.
+        :return: True if any input or return conversions apply.
+        """
+        for name, annotation in method.__annotations__.items():
+            if name == 'return':
+                converters = self._return_converters
+            else:
+                converters = self._input_converters
+            annotation = eval_annotation(method, annotation)
+            if converters.get_type_converter(annotation) is not _noop_converter:
+                return True
+        return False
+
+    @staticmethod
+    def _compile_callable(
+            method: Callable,
+            signature: Signature,
+            return_converter: _TypeConverter,
+            input_converter: Optional[_ArgsConverter]
+        ) -> Optional[Callable]:
+        """Used internally to generate a wrapper specialized to `signature`,
+        with every conversion call written out inline.
+
+        :param method: The method to wrap.
+        :param signature: The signature the wrapper is generated from.
+        :param return_converter: Type converter to apply to return values.
+        :param input_converter: Argument converter to apply to the inputs.
+        :return: The generated wrapper, or None if the signature cannot be
+            handled by generated code.
+        """
+        namespace: Dict[str, Any] = {
+            '_method': method,
+            '_return': _unwrap_converter(return_converter),
+        }
+        conversions = input_converter._conversions if input_converter else {}
+        generated = _conversion_source(signature, conversions, namespace)
+        if generated is None:
+            return None
+        arg_list, body = generated
+        names = list(signature.parameters)
+        result = f'_method({", ".join(names)})'
+        if return_converter is _noop_converter:
+            body.append(f'    return {result}')
+        elif isinstance(return_converter, _UnboundTypeConverter):
+            if not names:
+                return None
+            body.append(f'    return _return({names[0]}, {result})')
+        else:
+            body.append(f'    return _return({result})')
+        source = '\n'.join([f'def wrapped({arg_list}):', *body])
+        return compile_function('wrapped', source, namespace)
+
     def convert_callable(
             self,
             method: Callable,
@@ -382,21 +821,38 @@ class ConversionWrapper:
         :return: A new method with the conversions specified, or the original
             method if no conversion are necessary.
         """
+        # Generated wrappers copy the parameters and defaults from the
+        # signature, so they are only correct when it describes `method` itself
+        # rather than a function it wraps
+        introspected = not signature and _is_plain_function(method)
         if not signature:
+            if _is_plain_function(method) and not self._needs_conversion(
+                    method):
+                # Determined from the annotations alone, so no `Signature` is
+                # needed
+                return method
             signature = inspect.signature(method, **_sig_args)
-        print(f'Creating wrapper for {method}, using {signature!r}.')
         return_converter, input_converter = self._get_callable_converters(
             method, signature)
+        if return_converter is _noop_converter and not input_converter:
+            # No conversions needed
+            return method
+        if introspected:
+            compiled = self._compile_callable(method, signature,
+                                              return_converter, input_converter)
+            if compiled:
+                return wraps(method)(compiled)
+        # Supplied, variadic or otherwise unusual signature, use a generic
+        # wrapper
+        if input_converter:
+            # Skip the `_ArgsConverter.__call__` indirection on every call
+            bind = input_converter._bind_and_convert
         if return_converter is _noop_converter:
-            if not input_converter:
-                # No conversions needed
-                return method
-            else:
-                # Input conversion only
-                @wraps(method)
-                def wrapped(*args, **kwargs):
-                    args, kwargs = input_converter(*args, **kwargs)
-                    return method(*args, **kwargs)
+            # Input conversion only
+            @wraps(method)
+            def wrapped(*args, **kwargs):
+                args, kwargs = bind(*args, **kwargs)
+                return method(*args, **kwargs)
         elif isinstance(return_converter, _UnboundTypeConverter):
             if not input_converter:
                 # Return conversion only, using an unbound method
@@ -408,7 +864,7 @@ class ConversionWrapper:
                 # Input and return conversion, using unbound methods
                 @wraps(method)
                 def wrapped(instance, *args, **kwargs): # type: ignore
-                    args, kwargs = input_converter(instance, *args, **kwargs)
+                    args, kwargs = bind(instance, *args, **kwargs)
                     return return_converter(instance, method(*args, **kwargs))
         else:
             if not input_converter:
@@ -420,7 +876,7 @@ class ConversionWrapper:
                 # Input and return conversions
                 @wraps(method)
                 def wrapped(*args, **kwargs):
-                    args, kwargs = input_converter(*args, **kwargs)
+                    args, kwargs = bind(*args, **kwargs)
                     return return_converter(method(*args, **kwargs))
         return wrapped
 
@@ -439,16 +895,19 @@ class ConversionWrapper:
         """
         fget, fset = prop.fget, prop.fset
         if get_annotation is None and fget:
-            get_annotation = get_type_hints(fget).get('return', None)
+            # Stringized annotations are resolved by `eval_annotation` below
+            get_annotation = getattr(fget, '__annotations__', {}).get('return')
         if fget:
             get_annotation = eval_annotation(fget, get_annotation)
         get_converter = self._return_converters.get_type_converter(
             get_annotation)
         if set_annotation is None and fset:
-            hints = get_type_hints(fset)
-            hints.pop('return', None)
-            if hints:
-                set_annotation = next(iter(hints.values()))
+            set_annotation = next(
+                (annotation for name, annotation
+                 in getattr(fset, '__annotations__', {}).items()
+                 if name != 'return'),
+                None
+            )
         if fset:
             set_annotation = eval_annotation(fset, set_annotation)
         set_converter = self._input_converters.get_type_converter(
@@ -475,34 +934,38 @@ class ConversionWrapper:
         :return: A new property with the conversions specified, or the original
             property if no conversion are necessary.
         """
+        if (get_annotation is None and set_annotation is None and
+                all(map(_is_unannotated, filter(None, (prop.fget, prop.fset))))):
+            # No conversions possible, skip introspection entirely
+            return prop
         get_converter, set_converter = self._get_property_converters(
             prop, get_annotation, set_annotation)
         if not (fget := prop.fget) or get_converter is _noop_converter:
             # No conversion needed on getter
             getter = fget   # type: ignore
-        elif isinstance(get_converter, _UnboundTypeConverter):
-            # Convert on getter result with an unbound method
-            @wraps(fget)
-            def getter(instance):
-                return get_converter(instance, fget(instance))
         else:
-            # Convert on getter result with normal method
-            @wraps(fget)
-            def getter(instance):
-                return get_converter(fget(instance))
+            if isinstance(get_converter, _UnboundTypeConverter):
+                # Convert on getter result with an unbound method
+                result = '_convert(instance, _fget(instance))'
+            else:
+                # Convert on getter result with normal method
+                result = '_convert(_fget(instance))'
+            getter = wraps(fget)(compile_function('getter',
+                f'def getter(instance):\n    return {result}',
+                {'_fget': fget, '_convert': _unwrap_converter(get_converter)}))
         if not (fset := prop.fset) or set_converter is _noop_converter:
             # No conversion needed on setter
             setter = fset   # type: ignore
-        elif isinstance(set_converter, _UnboundTypeConverter):
-            # Convert on setter with an unbound method
-            @wraps(fset)
-            def setter(instance, value):
-                fset(instance, set_converter(instance, value))
         else:
-            # Convert on setter with a normal method
-            @wraps(fset)
-            def setter(instance, value):
-                fset(instance, set_converter(value))
+            if isinstance(set_converter, _UnboundTypeConverter):
+                # Convert on setter with an unbound method
+                value = '_convert(instance, value)'
+            else:
+                # Convert on setter with a normal method
+                value = '_convert(value)'
+            setter = wraps(fset)(compile_function('setter',
+                f'def setter(instance, value):\n    _fset(instance, {value})',
+                {'_fset': fset, '_convert': _unwrap_converter(set_converter)}))
         if getter is not fget or setter is not fset:
             return property(getter, setter, prop.fdel, prop.__doc__)
         else:
@@ -551,11 +1014,9 @@ class ConversionWrapper:
                     return 1
         """
         set_annotation = set_annotation or get_annotation
-        return partial(
-            self.convert_property,
-            get_annotation=get_annotation,
-            set_annotation=set_annotation
-        )
+        def wrapper(prop: property) -> property:
+            return self.convert_property(prop, get_annotation, set_annotation)
+        return wrapper
 
     def signature(self, method_or_str: Union[Callable, str]) -> Callable:
         """Sepecify a function signature to use for the converted method. On
@@ -587,11 +1048,16 @@ class ConversionWrapper:
             #        f'annotations on python versions under 3.10'
             #    )
             # Handle string specified signatures
-            globs = globals()
-            locals = {}
-            code = f'def foo{method_or_str}: pass'
-            exec(code, globs, locals)
-            signature = inspect.signature(locals['foo'], **_sig_args)
+            signature = _string_signatures.get(method_or_str, None)
+            if signature is None:
+                globs = globals()
+                locals = {}
+                code = f'def foo{method_or_str}: pass'
+                exec(code, globs, locals)
+                signature = inspect.signature(locals['foo'], **_sig_args)
+                _string_signatures[method_or_str] = signature
         else:
             signature = inspect.signature(method_or_str, **_sig_args)
-        return partial(self.convert_callable, signature=signature)
+        def wrapper(method: Callable) -> Callable:
+            return self.convert_callable(method, signature)
+        return wrapper
@@ -9,28 +9,42 @@ __all__ = [
 ]
 
 
-import sys
 from functools import wraps
-from typing import Any, Callable, Generic, get_args, TypeVar, Union
+from keyword import iskeyword
+from operator import attrgetter
+from typing import Any, Callable, Generic, get_args, Type, TypeVar, Union
 
-if sys.version_info >= (3, 10):
-    from functools import cache
-else:
-    from functools import lru_cache as cache
+from ._codegen import compile_function
 
 
 class ForwardWrapper:
     """Wrapper object for wrapping methods to be forwarded to a different
     object.  A resolver is used to get the object to forward to.
     """
+    __slots__ = ('_resolve', '_target')
     _resolve: Callable[[Any], Any]
+    # Source code expression used by the generated code to get the object to
+    # forward to, from `instance`.
+    _target: str
 
-    def __init__(self, resolver: Callable[[Any], Any]) -> None:
+    def __init__(self, resolver: Union[Callable[[Any], Any], str]) -> None:
         """Create the wrapper.
         
-        :param resolver: Method used to get the object to forward to.
+        :param resolver: Method used to get the object to forward to, or the
+            name of the attribute holding it.  Using an attribute name allows
+            the forwarding methods to read the attribute directly, rather than
+            calling a resolver method.
         """
-        self._resolve = resolver
+        if isinstance(resolver, str):
+            if not resolver.isidentifier() or iskeyword(resolver):
+                raise ValueError(
+                    f'{resolver!r} is not a valid attribute name.'
+                )
+            self._resolve = attrgetter(resolver)
+            self._target = f'instance.{resolver}'
+        else:
+            self._resolve = resolver
+            self._target = '_resolve(instance)'
 
     def wrap_property(self, prop: property) -> property:
         """Create a new property which forwards its getter, setter, and deleter
@@ -40,25 +54,30 @@ class ForwardWrapper:
         :return: A new property which forwards to `prop`.
         """
         fget, fset, fdel = prop.fget, prop.fset, prop.fdel
-        resolve = self._resolve
+        target = self._target
+        namespace = {'_resolve': self._resolve, '_fget': fget, '_fset': fset,
+                     '_fdel': fdel}
         if fget:
-            @wraps(fget)
-            def getter(instance) -> Any:
-                return fget(resolve(instance))
+            getter = wraps(fget)(compile_function('getter',
+                'def getter(instance):\n'
+                f'    return _fget({target})',
+                namespace))
         else:
-            getter = None   # type: ignore
+            getter = None
         if fset:
-            @wraps(fset)
-            def setter(instance, value: Any) -> None:
-                fset(resolve(instance), value)
+            setter = wraps(fset)(compile_function('setter',
+                'def setter(instance, value):\n'
+                f'    _fset({target}, value)',
+                namespace))
         else:
-            setter = None   # type: ignore
+            setter = None
         if fdel:
-            @wraps(fdel)
-            def deleter(instance) -> None:
-                fdel(resolve(instance))
+            deleter = wraps(fdel)(compile_function('deleter',
+                'def deleter(instance):\n'
+                f'    _fdel({target})',
+                namespace))
         else:
-            deleter = None  # type: ignore
+            deleter = None
         return property(getter, setter, deleter, prop.__doc__)
 
     def wrap_method(self, method: Callable) -> Callable:
@@ -68,11 +87,13 @@ class ForwardWrapper:
         :param method: Unbound method on the forwarded class.
         :return: A new method which forwards to `method`.
         """
-        resolve = self._resolve
-        @wraps(method)
-        def wrapped(instance, *args, **kwargs):
-            return method(resolve(instance), *args, **kwargs)
-        return wrapped
+        # Generated, so `_method` and `_resolve` are globals rather than
+        # closure cells.
+        wrapped = compile_function('wrapped',
+            'def wrapped(instance, *args, **kwargs):\n'
+            f'    return _method({self._target}, *args, **kwargs)',
+            {'_method': method, '_resolve': self._resolve})
+        return wraps(method)(wrapped)
     
     def __call__(
         self,
@@ -102,8 +123,11 @@ class ForwardWrapper:
             def my_method(a: int) -> bool:
                 pass
         """
+        # Generated up front: a stub forwards with a single direct call to
+        # `method`, the same as `forward(method)` would.
+        forwarder = self(method)
         def wrapper(_func: Callable) -> Callable:
-            return self(method) # type: ignore
+            return forwarder    # type: ignore
         return wrapper
 
 
@@ -125,42 +149,69 @@ class AForwarder(Generic[T]):
     class B(AForwarder[A]):
         foo = forward(A.foo)    
     """
+    # Subclasses still get a `__dict__` unless they also define `__slots__`,
+    # but `_wrapped_object` is always read from the slot.
+    __slots__ = ('_wrapped_object',)
     _wrapped_object: T
+    _wrapped_type_cached: Type[T]
 
     @classmethod
-    @cache
     def _wrapped_type(cls: type[C]) -> type[T]: # type: ignore
-        """Get the generic type `T` this class was created with."""
-        # NOTE: This is hacky in that it relies on internal details of the
-        # `typing` module.
-        generic = cls.__orig_bases__[0]     # type: ignore
-        return get_args(generic)[0]
+        """Get the generic type `T` this class was created with.  The result
+        is cached on the class itself.
+        """
+        try:
+            return cls.__dict__['_wrapped_type_cached']
+        except KeyError:
+            # NOTE: This is hacky in that it relies on internal details of the
+            # `typing` module.
+            generic = cls.__orig_bases__[0]     # type: ignore
+            wrapped_type = get_args(generic)[0]
+            cls._wrapped_type_cached = wrapped_type # type: ignore
+            return wrapped_type
 
     def __init__(self, *args, **kwargs) -> None:
         """Initialize by either creating a new `_wrapped_object` instance,
         or wrapping an existing one.  Wrapping an existing instance should
         be accomplished via the `wrap` class method.
         """
-        wrapped_type = self._wrapped_type()
         if (instance := kwargs.pop('_do_wrap', False)):
-            if not isinstance(instance, wrapped_type):
-                raise TypeError(
-                    f'Forwarder for type {wrapped_type} cannot wrap {instance} '
-                    f'of type {type(instance)}.'
-                )
-            self._wrapped_object = instance
+            self._wrapped_object = self._check_wrappable(instance)
         else:
-            self._wrapped_object = wrapped_type(*args, **kwargs)
+            self._wrapped_object = self._wrapped_type()(*args, **kwargs)
+
+    @classmethod
+    def _check_wrappable(cls, instance: Any) -> T:
+        """Ensure an existing object can be wrapped by this class.
+
+        :param instance: The object to be wrapped.
+        :raises TypeError: If `instance` is not an instance of the wrapped type.
+        :return: `instance`, unchanged.
+        """
+        wrapped_type = cls._wrapped_type()
+        if not isinstance(instance, wrapped_type):
+            raise TypeError(
+                f'Forwarder for type {wrapped_type} cannot wrap {instance} '
+                f'of type {type(instance)}.'
+            )
+        return instance
 
     def resolve(self) -> T:
         return self._wrapped_object
 
     @classmethod
     def wrap(cls: type[C], to_wrap_instance: Any) -> C: # type: ignore
-        return cls(_do_wrap=to_wrap_instance)
+        if cls.__init__ is not AForwarder.__init__:
+            # Subclasses may need their own initialization
+            return cls(_do_wrap=to_wrap_instance)
+        # Otherwise store the object directly, skipping `__init__`
+        forwarder = cls.__new__(cls)
+        forwarder._wrapped_object = cls._check_wrappable(to_wrap_instance)
+        return forwarder
 
 
-forward = ForwardWrapper(AForwarder.resolve)
+# Reads `_wrapped_object` directly, rather than calling `AForwarder.resolve`
+forward = ForwardWrapper('_wrapped_object')
 
 
 class _ForwarderMeta(type):
@@ -193,4 +244,4 @@ class Forwarder(AForwarder[T], metaclass=_ForwarderMeta):
         # Note: no need to create `forward` first
         foo = forward(A.foo)
     """
-    pass
+    __slots__ = ()
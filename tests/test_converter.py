@@ -1,14 +1,19 @@
 # type: ignore
 __author__ = 'Lojack'
 
+from functools import partial, wraps
 import sys
 from typing import Union, Tuple
+from unittest.mock import MagicMock
 
 import pytest
 
 from decorators import ConversionWrapper
 
 
+_bool_strings = {'True': True, 'False': False}
+
+
 @pytest.fixture
 def convert() -> ConversionWrapper:
     return_converters = {
@@ -28,7 +33,7 @@ def converting_class():
             return str(value)
         
         def unwrap_boolstr(self, value: str) -> bool:
-            return eval(value)
+            return _bool_strings[value]
 
         def wrap_int(self, value: int) -> str:
             return str(value)
@@ -47,6 +52,23 @@ def test_creation_error():
         ConversionWrapper({Union[int, str]: bool})
 
 
+def test_shared_converters():
+    class Unhashable:
+        __hash__ = None
+        def __call__(self, value):
+            return str(value)
+
+    a = ConversionWrapper({bool: str}, {int: bool})
+    b = ConversionWrapper({bool: str}, {int: bool})
+    assert a._return_converters is b._return_converters
+    assert a._input_converters is b._input_converters
+    c = ConversionWrapper({bool: Unhashable()})
+    @c
+    def method() -> bool:
+        return True
+    assert method() == 'True'
+
+
 class TestMethods:
     # Test using non-instance converters
     def test_noop(self, convert: ConversionWrapper):
@@ -68,6 +90,11 @@ class TestMethods:
         def method(a):
             return a
         assert method(1) == 'True'
+        # Same signature string again
+        @convert.signature('(a: int) -> bool')
+        def method(a):
+            return not a
+        assert method(1) == 'False'
 
     def test_method_signature(self, convert: ConversionWrapper):
         @convert.signature
@@ -78,6 +105,46 @@ class TestMethods:
             return a
         assert method(1) == 'True'
 
+    def test_signature_defaults(self, convert: ConversionWrapper):
+        # Defaults come from the real method, not the supplied signature
+        @convert.signature
+        def stub(a, b=...) -> int:
+            pass
+        @stub
+        def method(a, b=5):
+            return a + b
+        assert method(1) == 6
+        @convert.signature
+        def stub(a: int, b=...) -> bool:
+            pass
+        @stub
+        def method(a, b=5):
+            return a, b
+        assert method(1) == "(True, 5)"
+        assert method(0, 1) == "(False, 1)"
+        # Return only conversions pass arguments straight through
+        @convert.signature('() -> bool')
+        def method(a, b=5):
+            return a == b
+        assert method(5) == 'True'
+
+    def test_wrapped_signature(self, convert: ConversionWrapper):
+        # `inspect.signature` follows `__wrapped__`, but the wrapper is what
+        # actually gets called
+        def method(ctx, flag) -> bool:
+            return flag
+        @wraps(method)
+        def inner(*args, **kwargs):
+            return method(42, *args, **kwargs)
+        assert convert(inner)(True) == 'True'
+
+        def method(a: int, b=1):
+            return a, b
+        @wraps(method)
+        def inner(a, b=99):
+            return method(a, b)
+        assert convert(inner)(1) == (True, 99)
+
     def test_return_no_input(self, convert: ConversionWrapper):
         @convert
         def method(a) -> bool:
@@ -107,6 +174,23 @@ class TestProperty:
         o.b = True
         assert o.b == 'True'
 
+    def test_string_annotations(self, convert: ConversionWrapper):
+        class A:
+            def __init__(self):
+                self._a = True
+
+            @property
+            def a(self) -> 'bool':
+                return self._a
+            @a.setter
+            def a(self, value: 'int') -> 'None':
+                self._a = value
+            a = convert(a)
+        o = A()
+        assert o.a == 'True'
+        o.a = 0
+        assert o.a == 'False'
+
     def test_noop(self, convert: ConversionWrapper):
         class A:
             # Both annotated, non-matching
@@ -130,6 +214,14 @@ class TestProperty:
         o = A()
         assert o.a == 1
 
+        # Unannotated properties are returned as is
+        def getter(self):
+            return 0
+        def setter(self, value):
+            pass
+        prop = property(getter, setter)
+        assert convert(prop) is prop
+
 
 class TestUnbound:
     def test_methods(self, converting_class):
@@ -159,6 +251,20 @@ class TestUnbound:
         assert o.return_no_input() is False
         assert o.return_with_input(False) is True
 
+    def test_variadic(self, converting_class):
+        convert = converting_class.convert
+        class B(converting_class):
+            @convert
+            def return_no_input(self, *args) -> str:
+                return 'False'
+
+            @convert
+            def return_with_input(self, a: bool, *args) -> str:
+                return a
+        o = B()
+        assert o.return_no_input(1) is False
+        assert o.return_with_input(True, 1) is True
+
     def test_property(self, converting_class):
         convert = converting_class.convert
         class B(converting_class):
@@ -207,6 +313,37 @@ class TestUnion:
         assert method(1) is True
         method('foo') == 'foo'
 
+    def test_subclass(self, convert: ConversionWrapper, converting_class):
+        class MyInt(int):
+            pass
+        @convert
+        def method(a: Union[int, float]):
+            return a
+        assert method(MyInt(1)) is True
+        convert = converting_class.convert
+        class B(converting_class):
+            @convert
+            def method(self, a: Union[int, float]):
+                return a
+        assert B().method(MyInt(1)) == '1'
+
+    def test_proxy(self, convert: ConversionWrapper):
+        # Mocks report a `__class__` other than their type
+        @convert
+        def method(a: Union[int, float]):
+            return a
+        assert method(MagicMock(spec=int)) is True
+        assert method(MagicMock(spec=float)) == 1
+
+    def test_order(self):
+        # Entries are matched in order, so `bool` is shadowed by `int`
+        convert = ConversionWrapper(None, {int: str, bool: int, float: int})
+        @convert
+        def method(a: Union[bool, float]):
+            return a
+        assert method(True) == 'True'
+        assert method(1.5) == 1
+
     def test_unbound(self, converting_class):
         convert = converting_class.convert
         class B(converting_class):
@@ -224,3 +361,90 @@ class TestUnion:
         assert o.mixed_unbound(1) == '1'
         assert o.mixed_unbound(1.5) == 1
         assert o.mixed_unbound('foo') == 'foo'
+
+
+def test_converter_arg_probing():
+    class A:
+        def to_str(self, value):
+            return str(value)
+
+    def add(x, y):
+        return x + y
+
+    # Bound methods and partials are single argument converters, even though
+    # their underlying functions take two arguments.
+    convert = ConversionWrapper({int: A().to_str, float: partial(add, 1.0)})
+
+    @convert
+    def method(a) -> Union[int, float]:
+        return a
+    assert method(1) == '1'
+    assert method(1.5) == 2.5
+
+    # Defaulted parameters still count, so this is an unbound method
+    class B:
+        def to_str(self, value=None):
+            return str(value)
+
+        convert = ConversionWrapper({int: to_str})
+
+        @convert
+        def method(self) -> int:
+            return 1
+    assert B().method() == '1'
+
+
+class TestArguments:
+    def test_defaults(self, convert: ConversionWrapper):
+        @convert
+        def method(a: int, b: int = 0, c=None):
+            return a, b, c
+        assert method(1) == (True, 0, None)
+        assert method(1, 2, 3) == (True, True, 3)
+        assert method(b=0, a=1) == (True, False, None)
+        with pytest.raises(TypeError):
+            method()
+
+    def test_variadic(self, convert: ConversionWrapper):
+        @convert
+        def method(a: int, *args, b: float, **kwargs):
+            return a, args, b, kwargs
+        assert method(1, 2, b=1.5, c=3) == (True, (2,), 1, {'c': 3})
+
+    def test_skipped_default(self, convert: ConversionWrapper):
+        @convert
+        def method(a: int, b=None, *, c: float, **kwargs):
+            return a, b, c, kwargs
+        assert method(1, c=1.5) == (True, None, 1, {})
+        assert method(c=1.5, a=0, d=2) == (False, None, 1, {'d': 2})
+        # Same call shapes again, using the cached argument locations
+        assert method(1, c=1.5) == (True, None, 1, {})
+        assert method(c=1.5, a=0, d=2) == (False, None, 1, {'d': 2})
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                method(1)
+
+    def test_converted_variadic(self, converting_class):
+        convert = converting_class.convert
+        class B(converting_class):
+            @convert
+            def method(self, a: bool, /, *args: float, b: int):
+                return a, args, b
+        o = B()
+        assert o.method(True, b=1) == ('True', (), '1')
+
+    def test_converted_variadic_extras(self):
+        convert = ConversionWrapper(None, {
+            int: str,
+            tuple: lambda values: tuple(map(str, values)),
+            dict: lambda values: {k: str(v) for k, v in values.items()},
+        })
+        @convert
+        def method(a: int, b=0, *args: tuple, c: int, d=None, **kwargs: dict):
+            return a, b, args, c, d, kwargs
+        result = method(1, 2, 3, 4, f=8, c=5, e=6, d=7)
+        assert result == ('1', 2, ('3', '4'), '5', 7, {'f': '8', 'e': '6'})
+        # Same keyword order `BoundArguments.kwargs` would give
+        assert list(result[-1]) == ['f', 'e']
+        # Skipping `b` forces everything after it to be passed by keyword
+        assert method(a=1, c=5) == ('1', 0, (), '5', None, {})
@@ -1,11 +1,12 @@
 # type: ignore
 __author__ = 'Lojack'
 
-from typing import TYPE_CHECKING
+from typing import get_type_hints, TYPE_CHECKING
 
 import pytest
 
-from decorators import Forwarder
+from decorators import AForwarder, Forwarder
+from decorators.forwarder import ForwardWrapper
 if TYPE_CHECKING:
     from decorators import forward
 
@@ -132,4 +133,46 @@ def test_meta():
         def forward(self):
             return 1
     o = C()
-    assert o.forward() == 1
\ No newline at end of file
+    assert o.forward() == 1
+
+
+def test_resolvers():
+    # Forwarding through a resolver method, rather than an attribute
+    forward = ForwardWrapper(AForwarder.resolve)
+    class C(AForwarder[A]):
+        foo = forward(A.foo)
+        bar = forward(A.bar)
+    o = C(1, 2)
+    assert o.foo() == 1
+    o.bar = 3
+    assert o.bar == 3
+
+    with pytest.raises(ValueError):
+        ForwardWrapper('not an attribute')
+    with pytest.raises(ValueError):
+        ForwardWrapper('class')
+
+
+def test_slots():
+    class C(Forwarder[A]):
+        __slots__ = ()
+        foo = forward(A.foo)
+    o = C(1, 2)
+    assert o.foo() == 1
+    with pytest.raises(AttributeError):
+        o.__dict__
+    # The class level annotations must evaluate on every supported version
+    assert get_type_hints(C)
+
+
+def test_wrap_custom_init():
+    class C(Forwarder[A]):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.initialized = True
+    a = A(1, 2)
+    o = C.wrap(a)
+    assert o.resolve() is a
+    assert o.initialized
+    with pytest.raises(TypeError):
+        C.wrap(1)